@@ -9,7 +9,7 @@ Usage:
 """
 
 import argparse
-import subprocess
+import os
 import sys
 from pathlib import Path
 
@@ -90,12 +90,13 @@ def main():
     print("Press Ctrl+C to stop the server")
     print("=" * 60 + "\n")
 
+    # Replace this process with mkdocs; it handles Ctrl+C itself.
+    # exec does not flush Python's buffers, so flush the banner first.
+    sys.stdout.flush()
+    os.chdir(fixture_dir)
     try:
-        subprocess.run(cmd, cwd=fixture_dir, check=True)
-    except KeyboardInterrupt:
-        print("\n\n✨ Server stopped")
-        sys.exit(0)
-    except subprocess.CalledProcessError as e:
+        os.execvp(cmd[0], cmd)
+    except OSError as e:
         print(f"\n❌ Error running mkdocs serve: {e}")
         sys.exit(1)
 
@@ -1,27 +1,39 @@
 """Configuration models for the SQLAlchemy plugin."""
 
+import re
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
-from typing import Literal, cast
+from typing import Any, Literal, cast
 
 from mdutils.tools.Header import AtxHeaderLevel
 
 from mkdocs_sqlalchemy_plugin.logger import logger
-
-FIELD = Literal[
-    "column", "type", "nullable", "default", "primary_key", "unique", "foreign_key"
-]
-FIELD_NAMES = [
-    "column",
-    "type",
-    "nullable",
-    "default",
-    "primary_key",
-    "unique",
-    "foreign_key",
+from mkdocs_sqlalchemy_plugin.utils import (
+    FIELD,
+    FIELD_NAMES,
+    parse_fields,
+)
+
+__all__ = [
+    "DEFAULT_CROSS",
+    "DEFAULT_FIELDS",
+    "DEFAULT_FIELDS_TUPLE",
+    "DEFAULT_TICK",
+    "FIELD",
+    "FIELD_NAMES",
+    "TAG_PATTERN",
+    "TAG_RE",
+    "DisplayConfig",
+    "FilterConfig",
+    "PluginConfig",
+    "TableGenerationOptions",
+    "TableStyleConfig",
+    "parse_fields",
 ]
+
 DEFAULT_TICK = "✔️"
 DEFAULT_CROSS = "❌"
-DEFAULT_FIELDS: list[str] = [
+DEFAULT_FIELDS_TUPLE: tuple[str, ...] = (
     "column",
     "type",
     "nullable",
@@ -29,7 +41,9 @@ DEFAULT_FIELDS: list[str] = [
     "primary_key",
     "unique",
     "foreign_key",
-]
+)
+"""Immutable default field order, shared by every config instance."""
+DEFAULT_FIELDS: list[str] = list(DEFAULT_FIELDS_TUPLE)
 TAG_PATTERN = r"\{%\s*sqlalchemy(?:\s+([^%]+?))?\s*%\}"
 """
 Regex pattern for matching SQLAlchemy tags.
@@ -40,9 +54,11 @@ This pattern enforces that:
 - Boolean parameters must not have quotes: key=true or key=false
 - The tag must be properly formatted: {% sqlalchemy ... %}
 """
+TAG_RE = re.compile(TAG_PATTERN)
+"""Compiled form of `TAG_PATTERN`, built once at import time."""
 
 
-@dataclass
+@dataclass(slots=True)
 class TableStyleConfig:
     """
     Configuration for table styling.
@@ -53,20 +69,20 @@ class TableStyleConfig:
     Attributes:
         tick (str): Symbol for true/yes values.
         cross (str): Symbol for false/no values.
-        fields (list[str]): List of fields to include in the table.
+        fields (Sequence[str]): Fields to include in the table, in order.
         heading_level (AtxHeaderLevel): Markdown heading level for table titles.
         text_align (Literal["left", "center", "right"]): Text alignment for table cells.
     """
 
     tick: str = DEFAULT_TICK
     cross: str = DEFAULT_CROSS
-    fields: list[str] = field(default_factory=lambda: DEFAULT_FIELDS.copy())
+    fields: Sequence[str] = DEFAULT_FIELDS_TUPLE
     heading_level: int = 3
     schema_heading_level: int = 2
     text_align: str = "left"
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterConfig:
     """
     Configuration for table filtering.
@@ -77,13 +93,21 @@ class FilterConfig:
     Attributes:
         include_tables (list[str] | None): List of table names to include.
         exclude_tables (list[str] | None): List of table names to exclude.
+        include_set (frozenset[str]): `include_tables` as a set, for lookups.
+        exclude_set (frozenset[str]): `exclude_tables` as a set, for lookups.
     """
 
     include_tables: list[str] | None = None
     exclude_tables: list[str] | None = None
+    include_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    exclude_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.include_set = frozenset(self.include_tables or ())
+        self.exclude_set = frozenset(self.exclude_tables or ())
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplayConfig:
     """
     Configuration for what to display in documentation.
@@ -106,7 +130,7 @@ class DisplayConfig:
     group_by_schema: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TableGenerationOptions:
     """
     Options for generating a single table's documentation.
@@ -128,7 +152,7 @@ class TableGenerationOptions:
         merge_with_tag_params: Create new options by merging with tag parameters.
     """
 
-    fields: list[str] = field(default_factory=lambda: DEFAULT_FIELDS.copy())
+    fields: list[str] = field(default_factory=lambda: list(DEFAULT_FIELDS_TUPLE))
     show_indexes: bool = True
     show_constraints: bool = True
     show_sql: bool = False
@@ -171,7 +195,7 @@ class TableGenerationOptions:
     ) -> "TableGenerationOptions":
         """Create options from style and display configs."""
         return cls(
-            fields=style.fields.copy(),
+            fields=list(style.fields),
             show_indexes=display.show_indexes,
             show_constraints=display.show_constraints,
             show_sql=display.show_sql,
@@ -189,39 +213,45 @@ class TableGenerationOptions:
 
         Tag parameters take precedence over existing options.
         """
-        from mkdocs_sqlalchemy_plugin.utils import parse_fields
-
         new_fields = self.fields
-        if "fields" in params:
-            parsed = parse_fields(str(params["fields"]))
-            if parsed:
-                new_fields = parsed
-
-        heading_level = self.int_to_heading_level(
-            int(params.get("heading_level", self.heading_level.value))
-        )
-        schema_heading_level = self.int_to_heading_level(
-            int(params.get("schema_heading_level", self.schema_heading_level.value))
-        )
-
-        text_align = self.str_to_text_align(
-            str(params.get("text_align", self.text_align))
-        )
-
-        return TableGenerationOptions(
-            fields=cast(list[str], new_fields),
-            show_indexes=bool(params.get("show_indexes", self.show_indexes)),
-            show_constraints=bool(
-                params.get("show_constraints", self.show_constraints)
-            ),
-            show_sql=bool(params.get("show_sql", self.show_sql)),
-            heading_level=heading_level,
-            schema_heading_level=schema_heading_level,
-            text_align=text_align,
-        )
-
-
-@dataclass
+        values: dict[str, Any] = {
+            "show_indexes": self.show_indexes,
+            "show_constraints": self.show_constraints,
+            "show_sql": self.show_sql,
+            "sql_dialect": self.sql_dialect,
+            "heading_level": self.heading_level,
+            "schema_heading_level": self.schema_heading_level,
+            "text_align": self.text_align,
+        }
+        for key, value in params.items():
+            if key == "fields":
+                parsed = parse_fields(str(value))
+                if parsed:
+                    new_fields = parsed
+                continue
+            coerce = _TAG_PARAM_COERCERS.get(key)
+            if coerce is not None:
+                values[key] = coerce(value)
+
+        return TableGenerationOptions(fields=cast(list[str], new_fields), **values)
+
+
+_TAG_PARAM_COERCERS: dict[str, Callable[[Any], Any]] = {
+    "show_indexes": bool,
+    "show_constraints": bool,
+    "show_sql": bool,
+    "heading_level": lambda value: TableGenerationOptions.int_to_heading_level(
+        int(value)
+    ),
+    "schema_heading_level": lambda value: TableGenerationOptions.int_to_heading_level(
+        int(value)
+    ),
+    "text_align": lambda value: TableGenerationOptions.str_to_text_align(str(value)),
+}
+"""Coercion applied to each tag parameter that overrides a generation option."""
+
+
+@dataclass(slots=True)
 class PluginConfig:
     """
     Main plugin configuration.
@@ -248,19 +278,29 @@ class PluginConfig:
     table_style: TableStyleConfig = field(default_factory=TableStyleConfig)
     filter: FilterConfig = field(default_factory=FilterConfig)
     display: DisplayConfig = field(default_factory=DisplayConfig)
+    _generation_options: TableGenerationOptions | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_generation_options(self) -> TableGenerationOptions:
-        """Get default table generation options from this config."""
-        return TableGenerationOptions.from_style_and_display(
-            self.table_style, self.display
-        )
+        """
+        Get default table generation options from this config.
+
+        The options are built on first use and reused afterwards, since the
+        config does not change during a build.
+        """
+        if self._generation_options is None:
+            self._generation_options = TableGenerationOptions.from_style_and_display(
+                self.table_style, self.display
+            )
+        return self._generation_options
 
     def should_include_table(self, tablename: str) -> bool:
         """Check if a table should be included based on filter config."""
-        if self.filter.exclude_tables and tablename in self.filter.exclude_tables:
+        if tablename in self.filter.exclude_set:
             return False
 
-        if self.filter.include_tables and tablename not in self.filter.include_tables:
+        if self.filter.include_set and tablename not in self.filter.include_set:
             return False
 
         return True
@@ -1,5 +1,10 @@
 import logging
 
+__all__ = [
+    "PluginLogFilter",
+    "logger",
+]
+
 
 class PluginLogFilter(logging.Filter):
     """Add a prefix to all log messages."""
@@ -1,7 +1,10 @@
-from dataclasses import dataclass
+import functools
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from functools import cached_property
 
 from mdutils.tools.Header import Header
-from mdutils.tools.Table import Table
 from mdutils.tools.TextUtils import TextUtils
 from sqlalchemy import Column as SaColumn
 from sqlalchemy import Table as SaTable
@@ -13,10 +16,28 @@ from sqlalchemy.sql.schema import DefaultGenerator
 from mkdocs_sqlalchemy_plugin.config import (
     PluginConfig,
     TableGenerationOptions,
+    TableStyleConfig,
 )
 from mkdocs_sqlalchemy_plugin.logger import logger
 from mkdocs_sqlalchemy_plugin.utils import parse_table_list
 
+__all__ = [
+    "SqlAlchemyPluginContext",
+    "clear_cache",
+    "generate_content_from_params",
+    "generate_table",
+    "generate_tables",
+    "generate_tables_by_schema",
+]
+
+_TABLE_CACHE: dict[tuple, str] = {}
+"""Rendered table documentation keyed by metadata, table name and options."""
+
+
+def clear_cache() -> None:
+    """Drop all memoized table documentation."""
+    _TABLE_CACHE.clear()
+
 
 @dataclass
 class SqlAlchemyPluginContext:
@@ -29,12 +50,16 @@ class SqlAlchemyPluginContext:
 
     Methods:
         get_filtered_tables: Get tables filtered by include/exclude lists.
+        get_sorted_tables: Get filtered tables in display order (memoized).
     """
 
     base_class: type[DeclarativeBase]
     plugin_config: PluginConfig
+    _sorted_tables_cache: dict[tuple, list[SaTable]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
-    @property
+    @cached_property
     def tables(self) -> list[SaTable]:
         """Get all tables from the base class metadata."""
         return self.base_class.metadata.sorted_tables
@@ -56,40 +81,39 @@ class SqlAlchemyPluginContext:
         logger.debug("Filtering tables from metadata")
         logger.debug(f"Total tables in metadata: {len(self.tables)}")
 
-        # Determine final include list (tag overrides config)
+        # Determine final include set (tag overrides config)
         final_include = (
-            include_tables
+            frozenset(include_tables)
             if include_tables
-            else self.plugin_config.filter.include_tables
+            else self.plugin_config.filter.include_set
         )
 
-        # Determine final exclude list (merge tag and config)
-        final_exclude = set(exclude_tables or [])
-        if self.plugin_config.filter.exclude_tables:
-            final_exclude.update(self.plugin_config.filter.exclude_tables)
+        # Determine final exclude set (merge tag and config)
+        final_exclude = self.plugin_config.filter.exclude_set
+        if exclude_tables:
+            final_exclude = final_exclude.union(exclude_tables)
 
         if final_include:
             logger.debug(f"Include filter: {final_include}")
         if final_exclude:
             logger.debug(f"Exclude filter: {final_exclude}")
 
-        filtered = []
-        excluded_count = 0
-        for table in self.tables:
-            # Check include list
-            if final_include and table.name not in final_include:
-                logger.debug(f"  Skipping table '{table.name}' (not in include list)")
-                excluded_count += 1
-                continue
-
-            # Check exclude list
-            if table.name in final_exclude:
-                logger.debug(f"  Skipping table '{table.name}' (in exclude list)")
-                excluded_count += 1
-                continue
-
-            filtered.append(table)
-            logger.debug(f"  Including table '{table.name}'")
+        tables = self.tables
+        filtered = [
+            table
+            for table in tables
+            if table.name not in final_exclude
+            and (not final_include or table.name in final_include)
+        ]
+        excluded_count = len(tables) - len(filtered)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            included_names = {table.name for table in filtered}
+            for table in tables:
+                if table.name in included_names:
+                    logger.debug(f"  Including table '{table.name}'")
+                else:
+                    logger.debug(f"  Skipping table '{table.name}' (filtered out)")
 
         logger.info(
             f"Filtered tables: {len(filtered)} included, {excluded_count} excluded "
@@ -100,6 +124,44 @@ class SqlAlchemyPluginContext:
 
         return filtered
 
+    def get_sorted_tables(
+        self,
+        include_tables: list[str] | None = None,
+        exclude_tables: list[str] | None = None,
+        sort_by: str = "name",
+    ) -> list[SaTable]:
+        """Get filtered tables in display order, memoized per filter and sort.
+
+        The context is rebuilt on every `on_config`, so the memoized lists
+        never outlive the metadata they were computed from.
+
+        Args:
+            include_tables: If provided, only include these tables (overrides config)
+            exclude_tables: If provided, also exclude these tables (merged with config)
+            sort_by: How to sort tables ('name' supported)
+
+        Returns:
+            List of filtered tables, shared between calls and not to be modified
+        """
+        # Filters are sets, so the same tables listed in another order hit
+        key = (
+            frozenset(include_tables) if include_tables else None,
+            frozenset(exclude_tables) if exclude_tables else None,
+            sort_by,
+        )
+        cached = self._sorted_tables_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Using cached table list for filter {key}")
+            return cached
+
+        tables = self.get_filtered_tables(include_tables, exclude_tables)
+        if sort_by == "name":
+            tables.sort(key=lambda t: t.name)
+            logger.debug("Tables sorted by name")
+
+        self._sorted_tables_cache[key] = tables
+        return tables
+
 
 def generate_table(
     context: SqlAlchemyPluginContext,
@@ -125,8 +187,30 @@ def generate_table(
     else:
         logger.debug(f"Using custom generation options: {options}")
 
+    # Get style config
+    style = context.plugin_config.table_style
+
+    cache_key = (
+        context.base_class.metadata,
+        tablename,
+        tuple(options.fields),
+        options.show_indexes,
+        options.show_constraints,
+        options.show_sql,
+        options.sql_dialect,
+        options.heading_level,
+        options.text_align,
+        style.tick,
+        style.cross,
+    )
+    cached = _TABLE_CACHE.get(cache_key)
+    if cached is not None:
+        logger.debug(f"Using cached documentation for table '{tablename}'")
+        return cached
+
     # Get the table
-    if tablename not in context.base_class.metadata.tables:
+    table = context.base_class.metadata.tables.get(tablename)
+    if table is None:
         available_tables = list(context.base_class.metadata.tables.keys())
         logger.error(
             f"Table '{tablename}' not found in metadata. "
@@ -134,100 +218,220 @@ def generate_table(
         )
         return f"<!-- Table '{tablename}' not found -->"
 
-    table = context.base_class.metadata.tables[tablename]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Table '{tablename}': {len(table.columns)} column(s), "
+            f"{len(table.indexes)} index(es), {len(table.constraints)} constraint(s)"
+        )
+
+    logger.debug(f"Using style config: fields={options.fields}")
+
+    sections = _generate_table_sections(table, options, style)
+    # Only the last section can end the document with blank lines
+    sections[-1] = sections[-1].rstrip("\n")
+    result = "\n".join(sections)
     logger.debug(
-        f"Table '{tablename}': {len(table.columns)} column(s), "
-        f"{len(table.indexes)} index(es), {len(table.constraints)} constraint(s)"
+        f"Generated {len(result)} characters of documentation for '{tablename}'"
     )
+    _TABLE_CACHE[cache_key] = result
+    return result
 
-    # Get style config
-    style = context.plugin_config.table_style
-    logger.debug(f"Using style config: fields={options.fields}")
 
-    output = []
+def _generate_table_sections(
+    table: SaTable, options: TableGenerationOptions, style: TableStyleConfig
+) -> list[str]:
+    """Generate the markdown sections documenting a table, in display order.
+
+    Args:
+        table: The table to document
+        options: Generation options
+        style: Table style configuration
+
+    Returns:
+        Header, column table and optional sections, to be joined by newlines
+    """
+    tablename = table.name
 
     # Table header - use configured heading level
     logger.debug(
         f"Generating header for table '{tablename}' at level {options.heading_level}"
     )
-    output.append(
+    sections = [
         Header.atx(
             level=options.heading_level,
             title=f"Table: {TextUtils.inline_code(table.name)}",
         )
-    )
+    ]
 
     # Generate table
     logger.debug(f"Generating column table for '{tablename}'")
-    text_list = list(options.fields)
-    for column in table.columns:
-        text_list += _generate_column_values(
-            column, options.fields, style.tick, style.cross
-        )
-
-    output.append(
-        Table().create_table(
-            columns=len(options.fields),
-            rows=len(table.columns) + 1,
-            text=text_list,
-            text_align=options.text_align,
-        )
-    )
+    rows = _generate_column_rows(table.columns, options.fields, style.tick, style.cross)
+    sections.append(_render_pipe_table(options.fields, rows, options.text_align))
 
     # Optional sections
     if options.show_sql:
         logger.debug(f"Generating SQL DDL for '{tablename}'")
-        output.append(_generate_sql_ddl(table, dialect=options.sql_dialect))
+        sections.append(_generate_sql_ddl(table, dialect=options.sql_dialect))
 
     if options.show_indexes:
         logger.debug(f"Generating indexes section for '{tablename}'")
-        output.append(_generate_indexes_section(table))
+        sections.append(_generate_indexes_section(table))
 
     if options.show_constraints:
         logger.debug(f"Generating constraints section for '{tablename}'")
-        output.append(_generate_constraints_section(table))
+        sections.append(_generate_constraints_section(table))
 
-    result = "\n".join(output).rstrip("\n")
-    logger.debug(
-        f"Generated {len(result)} characters of documentation for '{tablename}'"
+    return sections
+
+
+_ALIGN_CELLS: dict[str, str] = {
+    "center": " :---: |",
+    "left": " :--- |",
+    "right": " ---: |",
+}
+"""Separator cell for each supported text alignment."""
+
+
+def _pipe_row(cells: list[str]) -> str:
+    """Join cells into a pipe table row, escaping pipes inside the cells."""
+    return "|" + "|".join([cell.replace("|", r"\|") for cell in cells]) + "|"
+
+
+def _render_pipe_table(
+    headers: list[str], rows: list[list[str]], text_align: str
+) -> str:
+    """Render a markdown pipe table.
+
+    The output matches mdutils' `Table.create_table`, including the leading
+    and trailing newlines, without going through its per-cell concatenation.
+
+    Args:
+        headers: Header cells
+        rows: Body rows, each with one cell per header
+        text_align: Alignment for every column ('left', 'center' or 'right')
+
+    Returns:
+        Markdown table
+    """
+    lines = [""] * (len(rows) + 4)
+    lines[1] = _pipe_row(headers)
+    lines[2] = "|" + _ALIGN_CELLS[text_align.lower()] * len(headers)
+    for i, row in enumerate(rows, 3):
+        lines[i] = _pipe_row(row)
+    return "\n".join(lines)
+
+
+def _format_foreign_keys(column: SaColumn) -> str:
+    """Format the foreign key targets of a column for display."""
+    if not column.foreign_keys:
+        return ""
+
+    fk_list = [f"{fk.column.table.name}.{fk.column.name}" for fk in column.foreign_keys]
+    return TextUtils.italics(", ".join(fk_list).replace(".", "&period;"))
+
+
+FieldFormatter = Callable[[SaColumn, str, str], str]
+"""Formatter producing a cell value from a column and the tick/cross symbols."""
+
+_FIELD_FORMATTERS: dict[str, FieldFormatter] = {
+    "column": lambda column, tick, cross: TextUtils.inline_code(column.name),
+    "type": lambda column, tick, cross: str(column.type),
+    "nullable": lambda column, tick, cross: tick if column.nullable else cross,
+    "default": lambda column, tick, cross: _format_default_value(column.default),
+    "primary_key": lambda column, tick, cross: tick if column.primary_key else cross,
+    "unique": lambda column, tick, cross: tick if column.unique else cross,
+    "foreign_key": lambda column, tick, cross: _format_foreign_keys(column),
+}
+
+
+def _format_unknown_field(column: SaColumn, tick: str, cross: str) -> str:
+    """Formatter for fields that are not recognized."""
+    return ""
+
+
+RowFunction = Callable[[SaColumn], list[str]]
+"""Function producing the cell values of one table row from a column."""
+
+
+@functools.lru_cache(maxsize=32)
+def _build_row_fn(fields: tuple[str, ...], tick: str, cross: str) -> RowFunction:
+    """Build a row function for the given fields and symbols.
+
+    The formatter of each field is resolved once, so rendering a row does
+    no per-column dispatch on field names.
+
+    Args:
+        fields: Fields to include, in order
+        tick: Symbol for true values
+        cross: Symbol for false values
+
+    Returns:
+        Function mapping a column to its list of cell values
+    """
+    formatters = tuple(
+        _FIELD_FORMATTERS.get(field, _format_unknown_field) for field in fields
     )
-    return result
+
+    def row_fn(column: SaColumn) -> list[str]:
+        return [fmt(column, tick, cross) for fmt in formatters]
+
+    return row_fn
 
 
 def _generate_column_values(
-    column: SaColumn, fields: list[str], tick: str, cross: str
+    column: SaColumn,
+    fields: list[str],
+    tick: str,
+    cross: str,
+    row_fn: RowFunction | None = None,
 ) -> list[str]:
-    """Generate values for each field in a column row."""
-    fk_list = (
-        [f"{fk.column.table.name}.{fk.column.name}" for fk in column.foreign_keys]
-        if column.foreign_keys
-        else []
-    )
-    fk_string = (
-        TextUtils.italics(", ".join(fk_list).replace(".", "&period;"))
-        if fk_list
-        else ""
-    )
+    """Generate values for each field in a column row.
 
-    default_value = _format_default_value(column.default)
+    Args:
+        column: The column to describe
+        fields: Fields to include, in order
+        tick: Symbol for true values
+        cross: Symbol for false values
+        row_fn: Row function for `fields`, as returned by `_build_row_fn`
+            (built from `fields` if not provided)
 
-    field_values: dict[str, str] = {
-        "column": TextUtils.inline_code(column.name),
-        "type": str(column.type),
-        "nullable": tick if column.nullable else cross,
-        "default": default_value,
-        "primary_key": tick if column.primary_key else cross,
-        "unique": tick if column.unique else cross,
-        "foreign_key": fk_string,
-    }
+    Returns:
+        One formatted value per field
+    """
+    if row_fn is None:
+        row_fn = _build_row_fn(tuple(fields), tick, cross)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"  Column '{column.name}': type={column.type}, "
+            f"nullable={column.nullable}, pk={column.primary_key}, "
+            f"unique={column.unique}, fks={len(column.foreign_keys)}"
+        )
+
+    return row_fn(column)
 
-    logger.debug(
-        f"  Column '{column.name}': type={column.type}, "
-        f"nullable={column.nullable}, pk={column.primary_key}, "
-        f"unique={column.unique}, fks={len(fk_list)}"
-    )
 
-    return [field_values.get(field, "") for field in fields]
+def _generate_column_rows(
+    columns: Iterable[SaColumn], fields: list[str], tick: str, cross: str
+) -> list[list[str]]:
+    """Generate the value rows for all columns of a table in one pass.
+
+    Args:
+        columns: The columns to describe, in display order
+        fields: Fields to include, in order
+        tick: Symbol for true values
+        cross: Symbol for false values
+
+    Returns:
+        One row of formatted values per column
+    """
+    row_fn = _build_row_fn(tuple(fields), tick, cross)
+    if logger.isEnabledFor(logging.DEBUG):
+        return [
+            _generate_column_values(column, fields, tick, cross, row_fn)
+            for column in columns
+        ]
+    return [row_fn(column) for column in columns]
 
 
 def _format_default_value(default: DefaultGenerator | None) -> str:
@@ -244,23 +448,36 @@ def _format_default_value(default: DefaultGenerator | None) -> str:
     return str(default)
 
 
+_BOLD_INDEXES = TextUtils.bold("Indexes:")
+_BOLD_CONSTRAINTS = TextUtils.bold("Constraints:")
+_INDEXES_NONE = f"\n{_BOLD_INDEXES} None\n"
+_CONSTRAINTS_NONE = f"\n{_BOLD_CONSTRAINTS} None\n"
+
+
 def _generate_indexes_section(table: SaTable) -> str:
     """Generate the indexes section for a table."""
     if not table.indexes:
         logger.debug(f"  No indexes for table '{table.name}'")
-        return f"\n{TextUtils.bold('Indexes:')} None\n"
-
-    logger.debug(f"  Found {len(table.indexes)} index(es) for table '{table.name}'")
-    lines = [f"\n{TextUtils.bold('Indexes:')}\n"]
-    for idx in table.indexes:
-        columns = ", ".join(TextUtils.inline_code(col) for col in idx.columns.keys())
-        idx_name = str(idx.name) if idx.name else str(id(idx))
-        lines.append(f"- {TextUtils.inline_code(idx_name)}: {columns}")
-        logger.debug(
-            f"    Index '{idx_name}': columns=[{', '.join(idx.columns.keys())}]"
-        )
+        return _INDEXES_NONE
+
+    indexes = list(table.indexes)
+    logger.debug(f"  Found {len(indexes)} index(es) for table '{table.name}'")
+    inline_code = TextUtils.inline_code
+    names = [str(idx.name) if idx.name else str(id(idx)) for idx in indexes]
+    body = "\n".join(
+        [
+            f"- {inline_code(name)}: "
+            + ", ".join([inline_code(col) for col in idx.columns.keys()])
+            for name, idx in zip(names, indexes)
+        ]
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        for name, idx in zip(names, indexes):
+            logger.debug(
+                f"    Index '{name}': columns=[{', '.join(idx.columns.keys())}]"
+            )
 
-    return "\n".join(lines) + "\n"
+    return f"\n{_BOLD_INDEXES}\n\n{body}\n"
 
 
 def _generate_constraints_section(table: SaTable) -> str:
@@ -271,17 +488,23 @@ def _generate_constraints_section(table: SaTable) -> str:
 
     if not constraints:
         logger.debug(f"  No named constraints for table '{table.name}'")
-        return f"\n{TextUtils.bold('Constraints:')} None\n"
+        return _CONSTRAINTS_NONE
 
     logger.debug(f"  Found {len(constraints)} constraint(s) for table '{table.name}'")
-    lines = [f"\n{TextUtils.bold('Constraints:')}\n"]
-    for constraint in constraints:
-        constraint_type = type(constraint).__name__
-        constraint_name = str(constraint.name or "Unknown")
-        lines.append(f"- {TextUtils.inline_code(constraint_name)} ({constraint_type})")
-        logger.debug(f"    Constraint '{constraint_name}': type={constraint_type}")
+    inline_code = TextUtils.inline_code
+    body = "\n".join(
+        [
+            f"- {inline_code(str(c.name or 'Unknown'))} ({type(c).__name__})"
+            for c in constraints
+        ]
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        for c in constraints:
+            logger.debug(
+                f"    Constraint '{c.name or 'Unknown'}': type={type(c).__name__}"
+            )
 
-    return "\n".join(lines) + "\n"
+    return f"\n{_BOLD_CONSTRAINTS}\n\n{body}\n"
 
 
 def _generate_sql_ddl(table: SaTable, dialect: str = "postgresql") -> str:
@@ -332,24 +555,24 @@ def generate_tables(
     logger.info("Generating documentation for multiple tables")
     logger.debug(f"Sort by: {sort_by}")
 
-    filtered_tables = context.get_filtered_tables(include_tables, exclude_tables)
+    filtered_tables = context.get_sorted_tables(include_tables, exclude_tables, sort_by)
 
     if not filtered_tables:
         logger.warning("No tables match the filter criteria")
         return "<!-- No tables to document -->"
 
-    if sort_by == "name":
-        filtered_tables.sort(key=lambda t: t.name)
-        logger.debug("Tables sorted by name")
-
     if options is None:
         options = context.plugin_config.get_generation_options()
         logger.debug("Using default generation options")
 
     logger.info(f"Generating documentation for {len(filtered_tables)} table(s)")
+    debug = logger.isEnabledFor(logging.DEBUG)
     output = []
     for idx, table in enumerate(filtered_tables, 1):
-        logger.debug(f"Processing table {idx}/{len(filtered_tables)}: '{table.name}'")
+        if debug:
+            logger.debug(
+                f"Processing table {idx}/{len(filtered_tables)}: '{table.name}'"
+            )
         try:
             table_doc = generate_table(context, table.name, options)
             output.append(table_doc)
@@ -391,16 +614,12 @@ def generate_tables_by_schema(
     logger.info("Generating documentation for multiple tables by schema")
     logger.debug(f"Sort by: {sort_by}")
 
-    filtered_tables = context.get_filtered_tables(include_tables, exclude_tables)
+    filtered_tables = context.get_sorted_tables(include_tables, exclude_tables, sort_by)
 
     if not filtered_tables:
         logger.warning("No tables match the filter criteria")
         return "<!-- No tables to document -->"
 
-    if sort_by == "name":
-        filtered_tables.sort(key=lambda t: t.name)
-        logger.debug("Tables sorted by name")
-
     if options is None:
         options = context.plugin_config.get_generation_options()
         logger.debug("Using default generation options")
@@ -411,6 +630,7 @@ def generate_tables_by_schema(
         table_map.setdefault(schema, []).append(table)
 
     logger.info(f"Generating documentation for {len(filtered_tables)} table(s)")
+    debug = logger.isEnabledFor(logging.DEBUG)
     output = []
     for schema, tables in table_map.items():
         logger.info(f"Processing schema: '{schema}'")
@@ -421,9 +641,10 @@ def generate_tables_by_schema(
             )
         )
         for idx, table in enumerate(tables, 1):
-            logger.debug(
-                f"Processing table {idx}/{len(filtered_tables)}: '{table.name}'"
-            )
+            if debug:
+                logger.debug(
+                    f"Processing table {idx}/{len(filtered_tables)}: '{table.name}'"
+                )
             try:
                 table_name = (
                     f"{schema}.{table.name}" if schema != "default" else table.name
@@ -465,9 +686,12 @@ def generate_content_from_params(
     # Get base generation options from config
     base_options = context.plugin_config.get_generation_options()
 
-    # Merge with tag parameters (tag takes precedence)
-    options = base_options.merge_with_tag_params(params)
-    logger.debug(f"Merged generation options: {options}")
+    # Merge with tag parameters (tag takes precedence); a bare tag uses the defaults
+    if params:
+        options = base_options.merge_with_tag_params(params)
+        logger.debug(f"Merged generation options: {options}")
+    else:
+        options = base_options
 
     # Handle specific table
     if "table" in params:
@@ -476,8 +700,15 @@ def generate_content_from_params(
         return generate_table(context, table_name, options)
 
     # Handle multiple tables with filtering
-    include_tables = parse_table_list(str(params.get("include_tables", "")))
-    exclude_tables = parse_table_list(str(params.get("exclude_tables", "")))
+    # Most tags carry no filter override, so skip parsing absent keys
+    raw_include = params.get("include_tables")
+    include_tables = (
+        parse_table_list(str(raw_include)) if raw_include is not None else None
+    )
+    raw_exclude = params.get("exclude_tables")
+    exclude_tables = (
+        parse_table_list(str(raw_exclude)) if raw_exclude is not None else None
+    )
     sort_by = str(params.get("sort_by", "name"))
 
     if include_tables:
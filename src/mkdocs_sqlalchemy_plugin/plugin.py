@@ -1,6 +1,10 @@
+import hashlib
 import importlib
+import logging
+import os
+import re
+import stat
 import sys
-from pathlib import Path
 
 from mkdocs.config import base
 from mkdocs.config import config_options as c
@@ -8,13 +12,15 @@ from mkdocs.config.defaults import MkDocsConfig
 from mkdocs.plugins import BasePlugin, get_plugin_logger
 from mkdocs.structure.files import Files
 from mkdocs.structure.pages import Page
+from sqlalchemy import MetaData
+from sqlalchemy import Table as SaTable
 from sqlalchemy.orm import DeclarativeBase
 
 from mkdocs_sqlalchemy_plugin.config import (
     DEFAULT_CROSS,
-    DEFAULT_FIELDS,
+    DEFAULT_FIELDS_TUPLE,
     DEFAULT_TICK,
-    TAG_PATTERN,
+    TAG_RE,
     DisplayConfig,
     FilterConfig,
 )
@@ -26,19 +32,46 @@ from mkdocs_sqlalchemy_plugin.config import (
 )
 from mkdocs_sqlalchemy_plugin.markdown import (
     SqlAlchemyPluginContext,
+    clear_cache,
     generate_content_from_params,
 )
-from mkdocs_sqlalchemy_plugin.utils import match_tag_regex, parse_tag_parameters
+from mkdocs_sqlalchemy_plugin.utils import find_tag_matches, parse_tag_parameters
+
+__all__ = [
+    "DisplayConfigSchema",
+    "FilterConfigSchema",
+    "SqlAlchemyPlugin",
+    "SqlAlchemyPluginConfig",
+    "TableStyleConfig",
+]
 
 logger = get_plugin_logger(__name__)
 
+_MAX_LOGGED_TABLE_NAMES = 50
+"""Largest schema whose table names are all listed in the discovery log line."""
+_TRUNCATED_TABLE_NAMES = 10
+"""Number of table names listed for schemas above `_MAX_LOGGED_TABLE_NAMES`."""
+
+
+def _stat_is_dir(path: str) -> bool | None:
+    """Return whether `path` is a directory, or None if it does not exist.
+
+    A single `os.stat` answers both questions, where `Path.exists()` followed
+    by `Path.is_dir()` would stat the path twice.
+    """
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return stat.S_ISDIR(st.st_mode)
+
 
 class TableStyleConfig(base.Config):
     """MkDocs config schema for table styling."""
 
     tick = c.Type(str, default=DEFAULT_TICK)
     cross = c.Type(str, default=DEFAULT_CROSS)
-    fields = c.ListOfItems(c.Type(str), default=DEFAULT_FIELDS)
+    fields = c.ListOfItems(c.Type(str), default=list(DEFAULT_FIELDS_TUPLE))
     heading_level = c.Type(int, default=3)
     schema_heading_level = c.Type(int, default=2)
     text_align = c.Type(str, default="left")
@@ -75,10 +108,24 @@ class SqlAlchemyPluginConfig(base.Config):
 class SqlAlchemyPlugin(BasePlugin[SqlAlchemyPluginConfig]):  # pragma: no cover
     """MkDocs plugin for documenting SQLAlchemy models."""
 
+    def on_startup(self, *, command: str, dirty: bool) -> None:
+        """Reset the rendered page and base class caches.
+
+        Defining this hook makes MkDocs reuse the plugin instance across
+        `mkdocs serve` rebuilds, so these caches survive between them.
+        """
+        self._page_cache: dict[str, tuple[bytes, str]] = {}
+        # Loaded base classes keyed by (base_class, python_path, app_path)
+        self._base_class_cache: dict[tuple, type[DeclarativeBase]] = {}
+        self._cache_fingerprint: tuple | None = None
+
     def on_config(self, config: MkDocsConfig) -> MkDocsConfig:
         """Load the SQLAlchemy base class during configuration."""
         logger.info("Initializing SQLAlchemy documentation plugin")
 
+        # Drop documentation rendered against a previous configuration
+        clear_cache()
+
         if not self.config.base_class:
             logger.error(
                 "No base_class specified in plugin configuration - plugin will be disabled"
@@ -109,15 +156,27 @@ class SqlAlchemyPlugin(BasePlugin[SqlAlchemyPluginConfig]):  # pragma: no cover
             base_class=base_class,
             plugin_config=plugin_config,
         )
+        # Tag output for this build, keyed by the raw tag parameter string
+        self._render_cache: dict[str | None, str] = {}
+
+        # Rendered pages stay valid while the base class and config are unchanged
+        fingerprint = (base_class, repr(plugin_config))
+        if fingerprint != getattr(self, "_cache_fingerprint", None):
+            logger.debug("Plugin configuration changed - clearing page cache")
+            self._page_cache = {}
+            self._cache_fingerprint = fingerprint
 
         # Log discovered tables
-        self._log_discovered_tables(base_class)
+        self._log_discovered_tables(self._context.tables)
 
         logger.info("SQLAlchemy plugin initialization completed successfully")
         return config
 
     def _log_config_summary(self, config: DataclassPluginConfig) -> None:
         """Log a summary of the plugin configuration."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
         logger.debug("Plugin configuration:")
         logger.debug(f"  - Table style fields: {config.table_style.fields}")
         logger.debug(f"  - Show indexes: {config.display.show_indexes}")
@@ -131,14 +190,26 @@ class SqlAlchemyPlugin(BasePlugin[SqlAlchemyPluginConfig]):  # pragma: no cover
         if config.filter.exclude_tables:
             logger.debug(f"  - Exclude tables: {config.filter.exclude_tables}")
 
-    def _log_discovered_tables(self, base_class: type[DeclarativeBase]) -> None:
-        """Log information about discovered tables."""
-        tables = base_class.metadata.sorted_tables
-        table_names = [t.name for t in tables]
+    def _log_discovered_tables(self, tables: list[SaTable]) -> None:
+        """Log information about discovered tables.
 
-        logger.info(
-            f"Discovered {len(tables)} table(s) in metadata: {', '.join(table_names)}"
-        )
+        Takes the context's already sorted tables, since `sorted_tables`
+        re-sorts the whole metadata on every access.
+        """
+        if len(tables) <= _MAX_LOGGED_TABLE_NAMES:
+            logger.info(
+                f"Discovered {len(tables)} table(s) in metadata: "
+                f"{', '.join([t.name for t in tables])}"
+            )
+        else:
+            shown = ", ".join([t.name for t in tables[:_TRUNCATED_TABLE_NAMES]])
+            logger.info(
+                f"Discovered {len(tables)} table(s) in metadata: {shown}, ... "
+                f"({len(tables) - _TRUNCATED_TABLE_NAMES} more)"
+            )
+
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
 
         for table in tables:
             logger.debug(
@@ -157,7 +228,7 @@ class SqlAlchemyPlugin(BasePlugin[SqlAlchemyPluginConfig]):  # pragma: no cover
             table_style=DataclassTableStyleConfig(
                 tick=self.config.table_style.tick,
                 cross=self.config.table_style.cross,
-                fields=list(self.config.table_style.fields),
+                fields=tuple(self.config.table_style.fields),
                 heading_level=self.config.table_style.heading_level,
                 schema_heading_level=self.config.table_style.schema_heading_level,
                 text_align=self.config.table_style.text_align,
@@ -178,19 +249,19 @@ class SqlAlchemyPlugin(BasePlugin[SqlAlchemyPluginConfig]):  # pragma: no cover
     def _setup_python_paths(self) -> None:
         """Add configured paths to sys.path."""
         logger.debug("Setting up Python paths")
-        paths_to_add = []
+        paths_to_add: list[str] = []
 
         # Collect python_path entries
         if self.config.python_path:
             logger.debug(
                 f"Processing {len(self.config.python_path)} configured Python path(s)"
             )
-            for path_str in self.config.python_path:
-                path = Path(path_str)
-                if not path.exists():
+            for path in self.config.python_path:
+                is_dir = _stat_is_dir(path)
+                if is_dir is None:
                     logger.warning(f"Python path does not exist: {path}")
                     continue
-                if not path.is_dir():
+                if not is_dir:
                     logger.warning(f"Python path is not a directory: {path}")
                     continue
                 paths_to_add.append(path)
@@ -199,10 +270,11 @@ class SqlAlchemyPlugin(BasePlugin[SqlAlchemyPluginConfig]):  # pragma: no cover
         # Collect app_path
         if self.config.app_path:
             logger.debug(f"Processing configured app_path: {self.config.app_path}")
-            app_path = Path(self.config.app_path)
-            if not app_path.exists():
+            app_path = self.config.app_path
+            is_dir = _stat_is_dir(app_path)
+            if is_dir is None:
                 logger.warning(f"App path does not exist: {app_path}")
-            elif not app_path.is_dir():
+            elif not is_dir:
                 logger.warning(f"App path is not a directory: {app_path}")
             else:
                 paths_to_add.append(app_path)
@@ -210,10 +282,12 @@ class SqlAlchemyPlugin(BasePlugin[SqlAlchemyPluginConfig]):  # pragma: no cover
 
         # Add all valid paths to sys.path
         added_count = 0
+        existing = set(sys.path)
         for path in paths_to_add:
-            path_str = str(path.resolve())
-            if path_str not in sys.path:
+            path_str = os.path.abspath(path)
+            if path_str not in existing:
                 sys.path.insert(0, path_str)
+                existing.add(path_str)
                 logger.debug(f"Added to sys.path: {path_str}")
                 added_count += 1
             else:
@@ -225,9 +299,23 @@ class SqlAlchemyPlugin(BasePlugin[SqlAlchemyPluginConfig]):  # pragma: no cover
             logger.debug("No new paths added to sys.path")
 
     def _load_base_class(self) -> type[DeclarativeBase] | None:
-        """Load the SQLAlchemy base class from the configured module path."""
+        """Load the SQLAlchemy base class from the configured module path.
+
+        Successfully resolved classes are remembered per base class and path
+        settings, so `mkdocs serve` reloads skip the import and validation.
+        """
         logger.info(f"Loading SQLAlchemy base class: {self.config.base_class}")
 
+        cache_key = (
+            self.config.base_class,
+            tuple(self.config.python_path or ()),
+            self.config.app_path,
+        )
+        cached = self._base_class_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Using previously loaded base class")
+            return cached
+
         try:
             module_path, class_name = self.config.base_class.rsplit(".", 1)
             logger.debug(
@@ -270,16 +358,19 @@ class SqlAlchemyPlugin(BasePlugin[SqlAlchemyPluginConfig]):  # pragma: no cover
             )
             return None
 
-        if not issubclass(base_class, DeclarativeBase):
+        # Only the metadata is used, so check for it directly instead of the MRO
+        if not isinstance(getattr(base_class, "metadata", None), MetaData):
             logger.error(
                 f"Class '{class_name}' in module '{module_path}' is not a "
-                f"subclass of DeclarativeBase. Base classes: {base_class.__bases__}"
+                f"SQLAlchemy declarative base (no MetaData 'metadata' attribute). "
+                f"Base classes: {base_class.__bases__}"
             )
             return None
 
         logger.info(
             f"Successfully loaded SQLAlchemy base class: {self.config.base_class}"
         )
+        self._base_class_cache[cache_key] = base_class
         return base_class
 
     def on_page_markdown(
@@ -293,7 +384,21 @@ class SqlAlchemyPlugin(BasePlugin[SqlAlchemyPluginConfig]):  # pragma: no cover
             return None
 
         logger.debug(f"Processing page: {page.file.src_path}")
-        matches = match_tag_regex(markdown, TAG_PATTERN)
+        # Most pages never mention the plugin; skip the tag scan entirely.
+        # The tag allows any whitespace after "{%", so only the keyword is checked.
+        if "sqlalchemy" not in markdown:
+            logger.debug(f"No SQLAlchemy tags found in page: {page.file.src_path}")
+            return None
+
+        # Skip the tag scan and regeneration if the page source is unchanged
+        # since the last build
+        digest = hashlib.blake2b(markdown.encode(), digest_size=16).digest()
+        cached = self._page_cache.get(page.file.src_path)
+        if cached is not None and cached[0] == digest:
+            logger.debug(f"Page unchanged, using cached output: {page.file.src_path}")
+            return cached[1]
+
+        matches = find_tag_matches(markdown, TAG_RE)
 
         if not matches:
             logger.debug(f"No SQLAlchemy tags found in page: {page.file.src_path}")
@@ -303,26 +408,44 @@ class SqlAlchemyPlugin(BasePlugin[SqlAlchemyPluginConfig]):  # pragma: no cover
             f"Found {len(matches)} SQLAlchemy tag(s) in page: {page.file.src_path}"
         )
 
-        updated_markdown = markdown
+        updated_markdown, error_count = self._render_tags(
+            markdown, matches, page.file.src_path
+        )
+        # Pages with failed tags are retried on the next build
+        if error_count == 0:
+            self._page_cache[page.file.src_path] = (digest, updated_markdown)
+        return updated_markdown
+
+    def _render_tags(
+        self, markdown: str, matches: list[re.Match], src_path: str
+    ) -> tuple[str, int]:
+        """Replace each matched SQLAlchemy tag with its generated documentation.
+
+        Returns:
+            The updated markdown and the number of tags that failed to render.
+        """
+        parts: list[str] = []
+        last_end = 0
         success_count = 0
         error_count = 0
 
-        # Process matches in reverse order to avoid index shifting
-        for idx, match in enumerate(reversed(matches), 1):
+        # Rebuild the page in one pass, copying the text between tags as-is
+        for idx, match in enumerate(matches, 1):
             tag_params_str = match.group(1)
-            logger.debug(f"Processing tag {idx}/{len(matches)}: {tag_params_str}")
+            parts.append(markdown[last_end : match.start()])
+            last_end = match.end()
 
             try:
-                tag_params = parse_tag_parameters(tag_params_str)
-                logger.debug(f"  Parsed parameters: {tag_params}")
-
-                replacement = generate_content_from_params(self._context, tag_params)
-                start, end = match.span()
-                updated_markdown = (
-                    updated_markdown[:start] + replacement + updated_markdown[end:]
-                )
+                replacement = self._render_cache.get(tag_params_str)
+                if replacement is None:
+                    tag_params = parse_tag_parameters(tag_params_str)
+                    replacement = generate_content_from_params(
+                        self._context, tag_params
+                    )
+                    self._render_cache[tag_params_str] = replacement
+
+                parts.append(replacement)
                 success_count += 1
-                logger.debug(f"  Successfully generated documentation for tag {idx}")
 
             except Exception as e:
                 error_count += 1
@@ -331,22 +454,24 @@ class SqlAlchemyPlugin(BasePlugin[SqlAlchemyPluginConfig]):  # pragma: no cover
                     exc_info=True,
                 )
                 # Add error comment in place of tag
-                error_comment = (
-                    f"<!-- Error generating SQLAlchemy documentation: {e} -->"
-                )
-                start, end = match.span()
-                updated_markdown = (
-                    updated_markdown[:start] + error_comment + updated_markdown[end:]
-                )
-                continue
+                parts.append(f"<!-- Error generating SQLAlchemy documentation: {e} -->")
+
+        parts.append(markdown[last_end:])
+        updated_markdown = "".join(parts)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Tag parameters in page {src_path}: "
+                f"{[match.group(1) for match in matches]}"
+            )
 
         if success_count > 0:
             logger.info(
-                f"Successfully processed {success_count}/{len(matches)} tag(s) in page: {page.file.src_path}"
+                f"Successfully processed {success_count}/{len(matches)} tag(s) in page: {src_path}"
             )
         if error_count > 0:
             logger.warning(
-                f"Failed to process {error_count}/{len(matches)} tag(s) in page: {page.file.src_path}"
+                f"Failed to process {error_count}/{len(matches)} tag(s) in page: {src_path}"
             )
 
-        return updated_markdown
+        return updated_markdown, error_count
@@ -1,6 +1,17 @@
+import functools
 import re
 from typing import Literal
 
+__all__ = [
+    "FIELD",
+    "FIELD_NAMES",
+    "find_tag_matches",
+    "match_tag_regex",
+    "parse_fields",
+    "parse_table_list",
+    "parse_tag_parameters",
+]
+
 FIELD = Literal[
     "column", "type", "nullable", "default", "primary_key", "unique", "foreign_key"
 ]
@@ -13,20 +24,80 @@ FIELD_NAMES = [
     "unique",
     "foreign_key",
 ]
+_FIELD_SET = frozenset(FIELD_NAMES)
+"""`FIELD_NAMES` as a set, for constant-time membership tests."""
+
+_PARAM_RE = re.compile(r'(\w+)="([^"]*)"|(\w+)=(true|false)(?:\s|$)')
+"""
+Tag parameter: key="value" (groups 1-2) or unquoted key=true/false (groups 3-4).
+"""
 
 
-def match_tag_regex(markdown: str, pattern: str) -> list[re.Match]:
+def match_tag_regex(markdown: str, pattern: str | re.Pattern[str]) -> list[re.Match]:
     """
     Match all occurrences of the given tag pattern in the markdown.
 
     Args:
         markdown (str): The markdown content to search.
-        pattern (str): The regex pattern to match.
+        pattern (str | re.Pattern[str]): The regex pattern to match, either as
+            a source string or an already compiled pattern.
 
     Returns:
         List of regex match objects.
     """
-    return list(re.finditer(pattern, markdown))
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    return list(pattern.finditer(markdown))
+
+
+def find_tag_matches(
+    markdown: str, pattern: re.Pattern[str], prefix: str = "{%"
+) -> list[re.Match]:
+    """
+    Find all occurrences of a tag pattern, using `prefix` to locate candidates.
+
+    Candidate positions are found with `str.find`, and the pattern is only
+    tried (anchored) at those positions. Pages without `prefix` are rejected
+    after a single substring scan, without running the regex engine.
+
+    Args:
+        markdown (str): The markdown content to search.
+        pattern (re.Pattern[str]): Compiled pattern; every match must start
+            with `prefix`.
+        prefix (str): Literal text every match starts with.
+
+    Returns:
+        List of regex match objects, in document order.
+    """
+    matches = []
+    pos = markdown.find(prefix)
+    while pos != -1:
+        match = pattern.match(markdown, pos)
+        if match:
+            matches.append(match)
+            pos = markdown.find(prefix, match.end())
+        else:
+            pos = markdown.find(prefix, pos + 1)
+    return matches
+
+
+@functools.lru_cache(maxsize=256)
+def _split_fields(fields_str: str) -> tuple[FIELD, ...]:
+    """
+    Split a comma-separated fields string into known field names.
+
+    Pages usually repeat the same `fields` parameter across tags, so the
+    result is cached per string.
+
+    Args:
+        fields_str (str): Comma-separated string of field names.
+
+    Returns:
+        Tuple of FIELD literals, in the given order.
+    """
+    return tuple(
+        name for field in fields_str.split(",") if (name := field.strip()) in _FIELD_SET
+    )  # type: ignore
 
 
 def parse_fields(fields_str: str | None) -> list[FIELD] | None:
@@ -41,11 +112,7 @@ def parse_fields(fields_str: str | None) -> list[FIELD] | None:
     """
     if not fields_str:
         return None
-    return [
-        field.strip()
-        for field in str(fields_str).split(",")
-        if field.strip() in FIELD_NAMES
-    ]  # type: ignore
+    return list(_split_fields(fields_str))
 
 
 def parse_table_list(tables_str: str | None) -> list[str] | None:
@@ -60,7 +127,7 @@ def parse_table_list(tables_str: str | None) -> list[str] | None:
     """
     if not tables_str:
         return None
-    return [table.strip() for table in str(tables_str).split(",")]
+    return [table.strip() for table in tables_str.split(",")]
 
 
 def parse_tag_parameters(params_str: str | None) -> dict[str, int | str | bool]:
@@ -89,19 +156,17 @@ def parse_tag_parameters(params_str: str | None) -> dict[str, int | str | bool]:
         >>> parse_tag_parameters("table=users")  # Missing quotes - ignored
         {}
     """
-    if not params_str:
+    if not params_str or params_str.isspace():
         return {}
 
     params: dict[str, int | str | bool] = {}
 
-    # Match key="value" patterns (string parameters with quotes)
-    for match in re.finditer(r'(\w+)="([^"]*)"', params_str):
-        key, value = match.groups()
-        params[key] = value
-
-    # Match key=true/false patterns (boolean parameters without quotes)
-    for match in re.finditer(r"(\w+)=(true|false)(?:\s|$)", params_str):
-        key, value = match.groups()
-        params[key] = value == "true"
+    # A single scan handles both string (quoted) and boolean (unquoted) values
+    for match in _PARAM_RE.finditer(params_str):
+        string_key, string_value, bool_key, bool_value = match.groups()
+        if string_key is not None:
+            params[string_key] = string_value
+        else:
+            params[bool_key] = bool_value == "true"
 
     return params
@@ -0,0 +1,145 @@
+import os
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+import pytest
+from mkdocs.commands.build import build
+from mkdocs.config import load_config
+
+from mkdocs_sqlalchemy_plugin.config import PluginConfig
+from mkdocs_sqlalchemy_plugin.markdown import SqlAlchemyPluginContext
+
+from .fixtures.models import Base
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+
+# Fixture projects hold no tests: skip walking them during collection
+collect_ignore = ["fixtures"]
+
+
+class BuildResult(NamedTuple):
+    """Outcome of an in-process MkDocs build."""
+
+    exit_code: int
+    output: str
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink a fixture file, falling back to a copy across filesystems."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def setup_clean_mkdocs_folder(input_path: Path, output_path: Path) -> Path:
+    """
+    Sets up a clean MkDocs folder for testing.
+
+    Fixture files are hardlinked rather than copied: builds only read them
+    and write their output to a fresh ``site/`` directory.
+
+    Args:
+        input_path (Path): Path to the input MkDocs project directory.
+        output_path (Path): Path to the output MkDocs project directory.
+
+    Returns:
+        Path: The path to the temporary MkDocs directory.
+    """
+    tmp_project_path = output_path / input_path.name
+    shutil.copytree(input_path, tmp_project_path, copy_function=_link_or_copy)
+    return tmp_project_path
+
+
+def build_docs_setup(project_path: Path) -> BuildResult:
+    """
+    Builds the MkDocs documentation for the given project path.
+
+    The build runs in-process, mirroring what ``mkdocs build`` does without
+    going through Click's argument parsing and output capture. Like Click's
+    ``CliRunner``, build errors are reported through the result instead of
+    being raised.
+
+    Args:
+        project_path (Path): Path to the MkDocs project directory.
+
+    Returns:
+        BuildResult: The exit code and error output of the build.
+    """
+    # The plugin resolves app_path against the working directory
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(project_path)
+        try:
+            cfg = load_config()
+            cfg.plugins.on_startup(command="build", dirty=False)
+            try:
+                build(cfg, dirty=False)
+            finally:
+                cfg.plugins.on_shutdown()
+        except Exception as exc:
+            return BuildResult(exit_code=1, output=f"{type(exc).__name__}: {exc}")
+    return BuildResult(exit_code=0, output="")
+
+
+@pytest.fixture(scope="session")
+def default_context() -> SqlAlchemyPluginContext:
+    """
+    Plugin context for the test models with the default configuration.
+
+    Shared by the whole session, so tests must not modify it. Tests that
+    need a fresh context (e.g. to observe cold-cache logging) build their own.
+
+    Returns:
+        SqlAlchemyPluginContext: Context for `tests.fixtures.models.Base`.
+    """
+    return SqlAlchemyPluginContext(
+        base_class=Base, plugin_config=PluginConfig(base_class="Base")
+    )
+
+
+@pytest.fixture(scope="session")
+def build_site(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[str], Path]:
+    """
+    Builds fixture projects at most once per test session.
+
+    Builds are keyed by fixture name, so tests sharing a fixture reuse the
+    same ``site/`` directory. The cache is not persisted across sessions:
+    every run still exercises the plugin.
+
+    Returns:
+        Callable[[str], Path]: Function taking a fixture name and returning
+            the directory of its built site.
+    """
+    sites: dict[str, Path] = {}
+
+    def _build(name: str) -> Path:
+        site_path = sites.get(name)
+        if site_path is None:
+            project_path = setup_clean_mkdocs_folder(
+                FIXTURES_PATH / name, tmp_path_factory.mktemp(name)
+            )
+            result = build_docs_setup(project_path)
+            assert result.exit_code == 0, (
+                f"Build failed with exit code {result.exit_code}: {result.output}"
+            )
+            site_path = sites[name] = project_path / "site"
+        return site_path
+
+    return _build
+
+
+@pytest.fixture
+def built_site(
+    request: pytest.FixtureRequest, build_site: Callable[[str], Path]
+) -> Path:
+    """
+    Site directory of the fixture project named by an indirect parameter.
+
+    Returns:
+        Path: The built ``site/`` directory, shared across the session.
+    """
+    return build_site(request.param)
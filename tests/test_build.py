@@ -1,94 +1,55 @@
-import os
-import shutil
+from collections.abc import Callable, Iterable
 from pathlib import Path
 
-from click.testing import CliRunner, Result
-from mkdocs.__main__ import build_command
+import pytest
 
-
-def setup_clean_mkdocs_folder(input_path: Path, output_path: Path) -> Path:
-    """
-    Sets up a clean MkDocs folder for testing.
-
-    Args:
-        input_path (Path): Path to the input MkDocs project directory.
-        output_path (Path): Path to the output MkDocs project directory.
-
-    Returns:
-        Path: The path to the temporary MkDocs directory.
-    """
-    tmp_project_path = output_path / input_path.name
-    if tmp_project_path.exists():
-        shutil.rmtree(tmp_project_path)
-    shutil.copytree(input_path, tmp_project_path)
-    return tmp_project_path
+MODELS = ("users", "posts", "user_profiles")
 
 
-def build_docs_setup(project_path: Path) -> Result:
+def page_contains(page: Path, needles: Iterable[str]) -> set[str]:
     """
-    Builds the MkDocs documentation for the given project path.
+    Returns the needles that appear in a generated page.
 
     Args:
-        project_path (Path): Path to the MkDocs project directory.
+        page (Path): Path to the generated HTML page.
+        needles (Iterable[str]): Strings to look for.
 
     Returns:
-        Result: The result of the MkDocs build command.
+        set[str]: The needles found in the page.
     """
-
-    cwd = os.getcwd()
-    os.chdir(project_path)
-
-    try:
-        runner = CliRunner()
-        return runner.invoke(build_command, [])
-    except:
-        raise
-    finally:
-        os.chdir(cwd)
-
-
-def test_basic_setup(tmp_path: Path) -> None:
+    content = page.read_text(encoding="utf-8")
+    return {needle for needle in needles if needle in content}
+
+
+@pytest.mark.parametrize(
+    ("built_site", "expected"),
+    [
+        pytest.param("basic_setup", MODELS, id="basic_setup"),
+        pytest.param("theme", MODELS, id="theme"),
+        pytest.param("by_schema", (*MODELS, "profiles", "blog"), id="by_schema"),
+        pytest.param("by_schema_default", (*MODELS, "default"), id="by_schema_default"),
+        pytest.param("show_sql", (*MODELS, "View SQL"), id="show_sql"),
+    ],
+    indirect=["built_site"],
+)
+def test_models_page(built_site: Path, expected: tuple[str, ...]) -> None:
     """
-    Test the basic setup of the MkDocs SQLAlchemy plugin.
+    Test that the models page of a fixture project documents the expected content.
 
-    This test sets up a simple MkDocs project with a single model file
-    and verifies that the documentation is generated correctly.
+    Each fixture is a small MkDocs project documenting the same models with
+    a different plugin configuration (theme, grouping by schema, SQL DDL).
     """
-    # Setup a clean MkDocs folder
-    project_path = setup_clean_mkdocs_folder(
-        Path("tests/fixtures/basic_setup"), tmp_path
-    )
+    assert built_site.exists(), "Output directory does not exist."
 
-    # Build the documentation
-    result = build_docs_setup(project_path)
-    assert result.exit_code == 0, (
-        f"Build failed with exit code {result.exit_code}: {result.output}"
-    )
-
-    # Verify the output
-    output_dir = project_path / "site"
-    assert output_dir.exists(), "Output directory does not exist."
-
-    models_page = output_dir / "index.html"
+    models_page = built_site / "index.html"
     assert models_page.exists(), "Models page was not generated."
 
-    content = models_page.read_text(encoding="utf-8")
-    assert "users" in content, "User model not documented."
-    assert "posts" in content, "Post model not documented."
-    assert "user_profiles" in content, "UserProfile model not documented."
-
-
-def test_filter_fields(tmp_path: Path) -> None:
-    project_path = setup_clean_mkdocs_folder(
-        Path("tests/fixtures/filter_fields"), tmp_path
-    )
+    missing = set(expected) - page_contains(models_page, expected)
+    assert not missing, f"Not documented: {sorted(missing)}"
 
-    result = build_docs_setup(project_path)
-    assert result.exit_code == 0, (
-        f"Build failed with exit code {result.exit_code}: {result.output}"
-    )
 
-    output_dir = project_path / "site"
+def test_filter_fields(build_site: Callable[[str], Path]) -> None:
+    output_dir = build_site("filter_fields")
 
     assert output_dir.exists(), "Output directory does not exist."
 
@@ -98,32 +59,22 @@ def test_filter_fields(tmp_path: Path) -> None:
     user_page = output_dir / "users/index.html"
     assert user_page.exists(), "User page was not generated."
 
-    content = user_page.read_text(encoding="utf-8")
-    assert "column" in content, "Column 'column' should be documented."
-    assert "type" in content, "Column 'type' should be documented."
-    assert "nullable" in content, "Column 'nullable' should be documented."
-    assert "default" not in content, "Column 'default' should not be documented."
+    found = page_contains(user_page, ("column", "type", "nullable", "default"))
+    assert found == {"column", "type", "nullable"}, (
+        f"Expected columns 'column', 'type' and 'nullable' only, found {sorted(found)}"
+    )
 
     post_page = output_dir / "posts/index.html"
     assert post_page.exists(), "Post page was not generated."
 
-    content = post_page.read_text(encoding="utf-8")
-    assert "column" in content, "Column 'column' should be documented."
-    assert "unique" in content, "Column 'unique' should be documented."
-    assert "nullable" not in content, "Column 'nullable' should not be documented."
-
-
-def test_single_tables(tmp_path: Path) -> None:
-    project_path = setup_clean_mkdocs_folder(
-        Path("tests/fixtures/single_tables"), tmp_path
+    found = page_contains(post_page, ("column", "unique", "nullable"))
+    assert found == {"column", "unique"}, (
+        f"Expected columns 'column' and 'unique' only, found {sorted(found)}"
     )
 
-    result = build_docs_setup(project_path)
-    assert result.exit_code == 0, (
-        f"Build failed with exit code {result.exit_code}: {result.output}"
-    )
 
-    output_dir = project_path / "site"
+def test_single_tables(build_site: Callable[[str], Path]) -> None:
+    output_dir = build_site("single_tables")
 
     assert output_dir.exists(), "Output directory does not exist."
 
@@ -133,50 +84,29 @@ def test_single_tables(tmp_path: Path) -> None:
     user_page = output_dir / "users/index.html"
     assert user_page.exists(), "User page was not generated."
 
-    content = user_page.read_text(encoding="utf-8")
-    assert "users" in content, "User table not documented."
+    assert page_contains(user_page, ("users",)), "User table not documented."
 
     post_page = output_dir / "posts/index.html"
     assert post_page.exists(), "Post page was not generated."
 
-    content = post_page.read_text(encoding="utf-8")
-    assert "posts" in content, "Post table not documented."
-
+    assert page_contains(post_page, ("posts",)), "Post table not documented."
 
-def test_table_not_found(tmp_path: Path) -> None:
-    project_path = setup_clean_mkdocs_folder(
-        Path("tests/fixtures/table_not_found"), tmp_path
-    )
-
-    result = build_docs_setup(project_path)
-    assert result.exit_code == 0, (
-        f"Build failed with exit code {result.exit_code}: {result.output}"
-    )
 
-    output_dir = project_path / "site"
+def test_table_not_found(build_site: Callable[[str], Path]) -> None:
+    output_dir = build_site("table_not_found")
 
     assert output_dir.exists(), "Output directory does not exist."
 
     models_page = output_dir / "index.html"
     assert models_page.exists(), "Models page was not generated."
 
-    content = models_page.read_text(encoding="utf-8")
-    assert "<!-- Table 'not-found' not found -->" in content, (
+    assert page_contains(models_page, ("<!-- Table 'not-found' not found -->",)), (
         "Expected 'not found' comment"
     )
 
 
-def test_table_style(tmp_path: Path) -> None:
-    project_path = setup_clean_mkdocs_folder(
-        Path("tests/fixtures/table_style"), tmp_path
-    )
-
-    result = build_docs_setup(project_path)
-    assert result.exit_code == 0, (
-        f"Build failed with exit code {result.exit_code}: {result.output}"
-    )
-
-    output_dir = project_path / "site"
+def test_table_style(build_site: Callable[[str], Path]) -> None:
+    output_dir = build_site("table_style")
 
     assert output_dir.exists(), "Output directory does not exist."
 
@@ -186,107 +116,21 @@ def test_table_style(tmp_path: Path) -> None:
     user_page = output_dir / "users/index.html"
     assert user_page.exists(), "User page was not generated."
 
-    content = user_page.read_text(encoding="utf-8")
-    assert 'style="text-align: left;"' in content, (
-        "Expected text alignment style not found"
-    )
-    assert '<h2 id="table-users">Table: <code>users</code></h2>' in content, (
-        "Expected heading level h2 not found"
+    expected = {
+        'style="text-align: left;"',
+        '<h2 id="table-users">Table: <code>users</code></h2>',
+    }
+    assert expected.issubset(page_contains(user_page, expected)), (
+        "Expected left alignment and heading level h2 not found"
     )
 
     post_page = output_dir / "posts/index.html"
     assert post_page.exists(), "Post page was not generated."
 
-    content = post_page.read_text(encoding="utf-8")
-    assert 'style="text-align: center;"' in content, (
-        "Expected text alignment style not found"
-    )
-    assert '<h3 id="table-posts">Table: <code>posts</code></h3>' in content, (
-        "Expected heading level h3 not found"
-    )
-
-
-def test_theme(tmp_path: Path) -> None:
-    project_path = setup_clean_mkdocs_folder(Path("tests/fixtures/theme"), tmp_path)
-
-    result = build_docs_setup(project_path)
-    assert result.exit_code == 0, (
-        f"Build failed with exit code {result.exit_code}: {result.output}"
-    )
-
-    output_dir = project_path / "site"
-    assert output_dir.exists(), "Output directory does not exist."
-
-    models_page = output_dir / "index.html"
-    assert models_page.exists(), "Models page was not generated."
-
-    content = models_page.read_text(encoding="utf-8")
-    assert "users" in content, "User model not documented."
-    assert "posts" in content, "Post model not documented."
-    assert "user_profiles" in content, "UserProfile model not documented."
-
-
-def test_by_schema(tmp_path: Path) -> None:
-    project_path = setup_clean_mkdocs_folder(Path("tests/fixtures/by_schema"), tmp_path)
-
-    result = build_docs_setup(project_path)
-    assert result.exit_code == 0, (
-        f"Build failed with exit code {result.exit_code}: {result.output}"
-    )
-
-    output_dir = project_path / "site"
-    assert output_dir.exists(), "Output directory does not exist."
-
-    models_page = output_dir / "index.html"
-    assert models_page.exists(), "Models page was not generated."
-
-    content = models_page.read_text(encoding="utf-8")
-    assert "users" in content, "User model not documented."
-    assert "posts" in content, "Post model not documented."
-    assert "user_profiles" in content, "UserProfile model not documented."
-    assert "profiles" in content, "Schema 'profiles' not documented."
-    assert "blog" in content, "Schema 'blog' not documented."
-
-
-def test_by_schema_default(tmp_path: Path) -> None:
-    project_path = setup_clean_mkdocs_folder(
-        Path("tests/fixtures/by_schema_default"), tmp_path
-    )
-
-    result = build_docs_setup(project_path)
-    assert result.exit_code == 0, (
-        f"Build failed with exit code {result.exit_code}: {result.output}"
+    expected = {
+        'style="text-align: center;"',
+        '<h3 id="table-posts">Table: <code>posts</code></h3>',
+    }
+    assert expected.issubset(page_contains(post_page, expected)), (
+        "Expected center alignment and heading level h3 not found"
     )
-
-    output_dir = project_path / "site"
-    assert output_dir.exists(), "Output directory does not exist."
-
-    models_page = output_dir / "index.html"
-    assert models_page.exists(), "Models page was not generated."
-
-    content = models_page.read_text(encoding="utf-8")
-    assert "users" in content, "User model not documented."
-    assert "posts" in content, "Post model not documented."
-    assert "user_profiles" in content, "UserProfile model not documented."
-    assert "default" in content, "Schema 'default' not documented."
-
-
-def test_show_sql(tmp_path: Path) -> None:
-    project_path = setup_clean_mkdocs_folder(Path("tests/fixtures/show_sql"), tmp_path)
-
-    result = build_docs_setup(project_path)
-    assert result.exit_code == 0, (
-        f"Build failed with exit code {result.exit_code}: {result.output}"
-    )
-
-    output_dir = project_path / "site"
-    assert output_dir.exists(), "Output directory does not exist."
-
-    models_page = output_dir / "index.html"
-    assert models_page.exists(), "Models page was not generated."
-
-    content = models_page.read_text(encoding="utf-8")
-    assert "users" in content, "User model not documented."
-    assert "posts" in content, "Post model not documented."
-    assert "user_profiles" in content, "UserProfile model not documented."
-    assert "View SQL" in content, "Expected SQL DDL not found in documentation."
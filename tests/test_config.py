@@ -68,6 +68,29 @@ class TestTableGenerationOptions:
 
         assert merged_options.heading_level == initial_options.heading_level
 
+    def test_int_to_heading_level_not_a_number(self):
+        """Test that a non-numeric heading level falls back to the default."""
+        heading_level = TableGenerationOptions.int_to_heading_level("abc")  # type: ignore
+
+        assert heading_level.value == 2
+
+    def test_int_to_heading_level_unhashable(self):
+        """Test that a list heading level from YAML falls back to the default."""
+        heading_level = TableGenerationOptions.int_to_heading_level([3])  # type: ignore
+
+        assert heading_level.value == 2
+
+
+class TestFilterConfig:
+    """Tests for FilterConfig dataclass."""
+
+    def test_filter_sets(self):
+        """Test that include/exclude lists are mirrored as frozensets."""
+        filter_config = FilterConfig(include_tables=["users", "orders"])
+
+        assert filter_config.include_set == frozenset({"users", "orders"})
+        assert filter_config.exclude_set == frozenset()
+
 
 class TestPluginConfig:
     """Tests for PluginConfig dataclass."""
@@ -88,6 +111,15 @@ class TestPluginConfig:
         assert options.show_indexes is True
         assert options.show_constraints is False
 
+    def test_get_generation_options_cached(self):
+        """Test that generation options are built once per config."""
+        plugin_config = PluginConfig(base_class="Base")
+
+        options = plugin_config.get_generation_options()
+
+        assert plugin_config.get_generation_options() is options
+        assert plugin_config == PluginConfig(base_class="Base")
+
     def test_should_include_table(self):
         """Test table inclusion/exclusion logic."""
         plugin_config = PluginConfig(
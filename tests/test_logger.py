@@ -0,0 +1,21 @@
+import logging
+
+from mkdocs_sqlalchemy_plugin.logger import PluginLogFilter, logger
+
+
+def _record(level: int, msg: str = "message") -> logging.LogRecord:
+    return logging.LogRecord(logger.name, level, __file__, 1, msg, None, None)
+
+
+class TestPluginLogFilter:
+    def test_prefixes_emitted_records(self):
+        record = _record(logging.INFO)
+        assert PluginLogFilter().filter(record) is True
+        assert record.msg == "mkdocs_sqlalchemy_plugin: message"
+
+    def test_uses_current_prefix(self):
+        log_filter = PluginLogFilter()
+        log_filter.prefix = "custom"
+        record = _record(logging.INFO)
+        log_filter.filter(record)
+        assert record.msg == "custom: message"
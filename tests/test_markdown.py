@@ -1,12 +1,18 @@
+import logging
+
+import pytest
+from mdutils.tools.Table import Table as MdTable
 from sqlalchemy import Column, Index, Integer, MetaData, String, Table
 
 from mkdocs_sqlalchemy_plugin.config import (
     DEFAULT_CROSS,
     DEFAULT_FIELDS,
     DEFAULT_TICK,
+    DisplayConfig,
     FilterConfig,
     PluginConfig,
 )
+from mkdocs_sqlalchemy_plugin.logger import logger
 from mkdocs_sqlalchemy_plugin.markdown import (
     SqlAlchemyPluginContext,
     _format_default_value,
@@ -14,6 +20,8 @@ from mkdocs_sqlalchemy_plugin.markdown import (
     _generate_constraints_section,
     _generate_indexes_section,
     _generate_sql_ddl,
+    _render_pipe_table,
+    clear_cache,
     generate_content_from_params,
     generate_table,
     generate_tables,
@@ -23,106 +31,130 @@ from mkdocs_sqlalchemy_plugin.markdown import (
 from .fixtures.models import Base, User
 
 
-class TestSqlAlchemyPluginContext:
-    """Tests for SqlAlchemyPluginContext dataclass."""
+def make_context(filter_config: FilterConfig | None = None) -> SqlAlchemyPluginContext:
+    """Build a fresh plugin context for the test models."""
+    plugin_config = PluginConfig(
+        base_class="Base", filter=filter_config or FilterConfig()
+    )
+    return SqlAlchemyPluginContext(base_class=Base, plugin_config=plugin_config)
 
-    def test_get_filtered_tables(self):
-        """Test filtering tables with no filters."""
 
-        plugin_config = PluginConfig(base_class="Base")
+class TestSqlAlchemyPluginContext:
+    """Tests for SqlAlchemyPluginContext dataclass."""
 
-        context = SqlAlchemyPluginContext(
-            base_class=Base,
-            plugin_config=plugin_config,
+    @pytest.mark.parametrize(
+        "filter_config,include_tables,exclude_tables,expected",
+        [
+            pytest.param(
+                None, None, None, ["users", "posts", "user_profiles"], id="no_filters"
+            ),
+            pytest.param(
+                None, ["users", "posts"], None, ["users", "posts"], id="include"
+            ),
+            pytest.param(
+                None, None, ["user_profiles"], ["users", "posts"], id="exclude"
+            ),
+            pytest.param(
+                FilterConfig(exclude_tables=["posts"]),
+                None,
+                ["user_profiles"],
+                ["users"],
+                id="merge_with_config",
+            ),
+        ],
+    )
+    def test_get_filtered_tables(
+        self,
+        default_context: SqlAlchemyPluginContext,
+        filter_config: FilterConfig | None,
+        include_tables: list[str] | None,
+        exclude_tables: list[str] | None,
+        expected: list[str],
+    ):
+        """Test filtering tables with tag include/exclude lists and config filters."""
+        context = (
+            default_context if filter_config is None else make_context(filter_config)
         )
 
-        filtered_tables = context.get_filtered_tables()
-
-        table_names = [table.name for table in filtered_tables]
-        assert ["users", "posts", "user_profiles"] == table_names
-
-    def test_get_filtered_tables_with_include(self):
-        """Test filtering tables with include list."""
-
-        plugin_config = PluginConfig(base_class="Base")
-
-        context = SqlAlchemyPluginContext(
-            base_class=Base,
-            plugin_config=plugin_config,
+        filtered_tables = context.get_filtered_tables(
+            include_tables=include_tables, exclude_tables=exclude_tables
         )
 
-        filtered_tables = context.get_filtered_tables(include_tables=["users", "posts"])
-
         table_names = [table.name for table in filtered_tables]
-        assert ["users", "posts"] == table_names
+        assert expected == table_names
 
-    def test_get_filtered_tables_with_exclude(self):
-        """Test filtering tables with exclude list."""
+    def test_get_filtered_tables_debug_log(self, caplog):
+        """Test that per-table decisions are logged at debug level."""
 
-        plugin_config = PluginConfig(base_class="Base")
+        context = make_context()
 
-        context = SqlAlchemyPluginContext(
-            base_class=Base,
-            plugin_config=plugin_config,
-        )
+        with caplog.at_level(logging.DEBUG, logger=logger.name):
+            context.get_filtered_tables(exclude_tables=["posts"])
 
-        filtered_tables = context.get_filtered_tables(exclude_tables=["user_profiles"])
+        assert "Including table 'users'" in caplog.text
+        assert "Skipping table 'posts' (filtered out)" in caplog.text
 
-        table_names = [table.name for table in filtered_tables]
-        assert ["users", "posts"] == table_names
+    def test_get_sorted_tables(self, default_context: SqlAlchemyPluginContext):
+        """Test that sorted table lists are memoized per filter."""
 
-    def test_get_filtered_tables_merge(self):
-        """Test filtering tables with base exclude and tag include/exclude."""
+        sorted_tables = default_context.get_sorted_tables(exclude_tables=["posts"])
 
-        plugin_config = PluginConfig(
-            base_class="Base", filter=FilterConfig(exclude_tables=["posts"])
+        table_names = [table.name for table in sorted_tables]
+        assert ["user_profiles", "users"] == table_names
+        assert (
+            default_context.get_sorted_tables(exclude_tables=["posts"]) is sorted_tables
         )
-
-        context = SqlAlchemyPluginContext(
-            base_class=Base,
-            plugin_config=plugin_config,
+        assert default_context.get_sorted_tables() is not sorted_tables
+
+    def test_get_sorted_tables_ignores_filter_order(
+        self, default_context: SqlAlchemyPluginContext
+    ):
+        """Test that filters listing the same tables in another order share a cache entry."""
+        sorted_tables = default_context.get_sorted_tables(
+            include_tables=["users", "posts"]
         )
 
-        filtered_tables = context.get_filtered_tables(
-            include_tables=None, exclude_tables=["user_profiles"]
+        assert (
+            default_context.get_sorted_tables(include_tables=["posts", "users"])
+            is sorted_tables
         )
 
-        table_names = [table.name for table in filtered_tables]
-        assert ["users"] == table_names
-
 
 class TestGenerateTable:
     """Tests for generate_table function."""
 
-    def test_generate_table_basic(self):
+    def test_generate_table_basic(self, default_context: SqlAlchemyPluginContext):
         """Test basic table generation."""
 
-        plugin_config = PluginConfig(base_class="Base")
-
-        context = SqlAlchemyPluginContext(
-            base_class=Base,
-            plugin_config=plugin_config,
-        )
-
-        tables_markdown = generate_table(context=context, tablename="users")
+        tables_markdown = generate_table(context=default_context, tablename="users")
 
         assert "## Table: ``users``" in tables_markdown
         assert "## Table: ``posts``" not in tables_markdown
 
-    def test_generate_table_nonexistent(self):
+    def test_generate_table_nonexistent(self, default_context: SqlAlchemyPluginContext):
         """Test generating a table that does not exist."""
 
-        plugin_config = PluginConfig(base_class="Base")
-
-        context = SqlAlchemyPluginContext(
-            base_class=Base,
-            plugin_config=plugin_config,
+        tables_markdown = generate_table(
+            context=default_context, tablename="nonexistent"
         )
 
-        tables_markdown = generate_table(context=context, tablename="nonexistent")
-
         assert "Table 'nonexistent' not found" in tables_markdown
 
+    def test_generate_table_cached(self, default_context: SqlAlchemyPluginContext):
+        """Test that repeated generation reuses the memoized output."""
+
+        clear_cache()
+        first = generate_table(context=default_context, tablename="users")
+        second = generate_table(context=default_context, tablename="users")
+
+        assert first is second
+
+        clear_cache()
+        third = generate_table(context=default_context, tablename="users")
+
+        assert third == first
+        assert third is not first
+
 
 class TestGenerateColumnValues:
     """Tests for _generate_column_values function."""
@@ -161,6 +193,40 @@ class TestGenerateColumnValues:
             DEFAULT_CROSS,
         ] == columns_markdown
 
+    def test_generate_column_values_unknown_field(self):
+        """Test that unknown fields produce empty values."""
+        columns_markdown = _generate_column_values(
+            column=User.username,
+            fields=["column", "unknown"],
+            tick=DEFAULT_TICK,
+            cross=DEFAULT_CROSS,
+        )
+
+        assert ["``username``", ""] == columns_markdown
+
+
+class TestRenderPipeTable:
+    """Tests for _render_pipe_table function."""
+
+    @pytest.mark.parametrize("text_align", ["left", "center", "right", "Center"])
+    def test_render_pipe_table_matches_mdutils(self, text_align):
+        """Test that the output is identical to mdutils' create_table."""
+        headers = ["column", "default"]
+        rows = [["``id``", ""], ["``kind``", "a|b"]]
+
+        expected = MdTable().create_table(
+            columns=2,
+            rows=3,
+            text=headers + rows[0] + rows[1],
+            text_align=text_align,
+        )
+
+        assert _render_pipe_table(headers, rows, text_align) == expected
+
+    def test_render_pipe_table_without_rows(self):
+        """Test rendering a header-only table."""
+        assert _render_pipe_table(["column"], [], "left") == "\n|column|\n| :--- |\n"
+
 
 class TestFormatDefaultValue:
     """Tests for _format_default_value function."""
@@ -302,17 +368,10 @@ class TestGenerateSQLDDL:
 class TestGenerateTablesBySchema:
     """Tests for generate_tables_by_schema function."""
 
-    def test_generate_tables_by_schema(self):
+    def test_generate_tables_by_schema(self, default_context: SqlAlchemyPluginContext):
         """Test generating markdown for all tables."""
 
-        plugin_config = PluginConfig(base_class="Base")
-
-        context = SqlAlchemyPluginContext(
-            base_class=Base,
-            plugin_config=plugin_config,
-        )
-
-        tables_markdown = generate_tables_by_schema(context=context)
+        tables_markdown = generate_tables_by_schema(context=default_context)
 
         assert "## Table: ``users``" in tables_markdown
         assert "## Table: ``posts``" in tables_markdown
@@ -321,35 +380,37 @@ class TestGenerateTablesBySchema:
     def test_generate_tables_by_schema_all_unfiltered(self):
         """Test generating markdown for all tables with filters that exclude all."""
 
-        plugin_config = PluginConfig(
-            base_class="Base",
-            filter=FilterConfig(exclude_tables=["users", "posts", "user_profiles"]),
-        )
-
-        context = SqlAlchemyPluginContext(
-            base_class=Base,
-            plugin_config=plugin_config,
+        context = make_context(
+            FilterConfig(exclude_tables=["users", "posts", "user_profiles"])
         )
 
         tables_markdown = generate_tables_by_schema(context=context)
 
         assert "<!-- No tables to document -->" in tables_markdown
 
+    def test_generate_tables_by_schema_debug_log(self, caplog):
+        """Test that per-table, column, index and constraint details are logged."""
+
+        context = make_context()
+
+        clear_cache()
+        with caplog.at_level(logging.DEBUG, logger=logger.name):
+            generate_tables_by_schema(context=context)
+
+        assert "Processing table 1/3: 'posts'" in caplog.text
+        assert "Table 'posts': 7 column(s)" in caplog.text
+        assert "  Column 'id': type=INTEGER" in caplog.text
+        assert "    Index 'ix_posts_updated_at': columns=[updated_at]" in caplog.text
+        assert "    Constraint 'pk_posts': type=PrimaryKeyConstraint" in caplog.text
+
 
 class TestGenerateTables:
     """Tests for generate_tables function."""
 
-    def test_generate_tables(self):
+    def test_generate_tables(self, default_context: SqlAlchemyPluginContext):
         """Test generating markdown for all tables."""
 
-        plugin_config = PluginConfig(base_class="Base")
-
-        context = SqlAlchemyPluginContext(
-            base_class=Base,
-            plugin_config=plugin_config,
-        )
-
-        tables_markdown = generate_tables(context=context)
+        tables_markdown = generate_tables(context=default_context)
 
         assert "## Table: ``users``" in tables_markdown
         assert "## Table: ``posts``" in tables_markdown
@@ -358,34 +419,33 @@ class TestGenerateTables:
     def test_generate_tables_all_unfiltered(self):
         """Test generating markdown for all tables with filters that exclude all."""
 
-        plugin_config = PluginConfig(
-            base_class="Base",
-            filter=FilterConfig(exclude_tables=["users", "posts", "user_profiles"]),
-        )
-
-        context = SqlAlchemyPluginContext(
-            base_class=Base,
-            plugin_config=plugin_config,
+        context = make_context(
+            FilterConfig(exclude_tables=["users", "posts", "user_profiles"])
         )
 
         tables_markdown = generate_tables(context=context)
 
         assert "<!-- No tables to document -->" in tables_markdown
 
+    def test_generate_tables_debug_log(self, caplog):
+        """Test that per-table progress is logged at debug level."""
+
+        context = make_context()
+
+        with caplog.at_level(logging.DEBUG, logger=logger.name):
+            generate_tables(context=context)
+
+        assert "Processing table 3/3: 'users'" in caplog.text
+
 
 class TestGenerateContentFromParams:
     """Tests for generate_content_from_params function."""
 
-    def test_generate_content_from_params(self):
+    def test_generate_content_from_params(
+        self, default_context: SqlAlchemyPluginContext
+    ):
         """Test generating content from tag parameters."""
 
-        plugin_config = PluginConfig(base_class="Base")
-
-        context = SqlAlchemyPluginContext(
-            base_class=Base,
-            plugin_config=plugin_config,
-        )
-
         params = {
             "include_tables": "users,posts",
             "exclude_tables": "user_profiles",
@@ -395,7 +455,7 @@ class TestGenerateContentFromParams:
         }
 
         content_markdown = generate_content_from_params(
-            context=context,
+            context=default_context,
             params=params,
         )
 
@@ -405,16 +465,30 @@ class TestGenerateContentFromParams:
         assert "|column|type|nullable|" in content_markdown
         assert "Constraints:" not in content_markdown
 
-    def test_generate_content_from_params_single_table(self):
-        """Test generating content for a single table from tag parameters."""
-
-        plugin_config = PluginConfig(base_class="Base")
-
+    def test_generate_content_from_params_sql_dialect(self):
+        """Test that bare and parametrized tags render DDL in the same dialect."""
         context = SqlAlchemyPluginContext(
             base_class=Base,
-            plugin_config=plugin_config,
+            plugin_config=PluginConfig(
+                base_class="Base",
+                display=DisplayConfig(show_sql=True, sql_dialect="mysql"),
+            ),
         )
 
+        bare = generate_content_from_params(context=context, params={})
+        with_params = generate_content_from_params(
+            context=context, params={"table": "users"}
+        )
+
+        for content_markdown in (bare, with_params):
+            assert "id INTEGER NOT NULL AUTO_INCREMENT" in content_markdown
+            assert "SERIAL" not in content_markdown
+
+    def test_generate_content_from_params_single_table(
+        self, default_context: SqlAlchemyPluginContext
+    ):
+        """Test generating content for a single table from tag parameters."""
+
         params = {
             "table": "users",
             "fields": "column,type,default",
@@ -423,7 +497,7 @@ class TestGenerateContentFromParams:
         }
 
         content_markdown = generate_content_from_params(
-            context=context,
+            context=default_context,
             params=params,
         )
 
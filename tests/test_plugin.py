@@ -0,0 +1,146 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from mkdocs.config.defaults import MkDocsConfig
+from sqlalchemy.orm import DeclarativeBase
+
+from mkdocs_sqlalchemy_plugin import plugin as plugin_module
+from mkdocs_sqlalchemy_plugin.plugin import SqlAlchemyPlugin, _stat_is_dir
+
+MARKDOWN = "# Models\n\n{% sqlalchemy %}\n"
+
+
+class TestStatIsDir:
+    """Tests for _stat_is_dir function."""
+
+    def test_stat_is_dir(self, tmp_path: Path):
+        """Test telling directories, files and missing paths apart."""
+        file_path = tmp_path / "models.py"
+        file_path.write_text("")
+
+        assert _stat_is_dir(str(tmp_path)) is True
+        assert _stat_is_dir(str(file_path)) is False
+        assert _stat_is_dir(str(tmp_path / "missing")) is None
+
+
+class TestPageCache:
+    """Tests for the per-page output cache kept across serve rebuilds."""
+
+    @staticmethod
+    def _plugin(**options) -> SqlAlchemyPlugin:
+        plugin = SqlAlchemyPlugin()
+        plugin.load_config({"base_class": "tests.fixtures.models.Base", **options})
+        plugin.on_startup(command="serve", dirty=False)
+        plugin.on_config(MkDocsConfig())
+        return plugin
+
+    @staticmethod
+    def _render(plugin: SqlAlchemyPlugin, markdown: str) -> str | None:
+        page = SimpleNamespace(file=SimpleNamespace(src_path="index.md"))
+        return plugin.on_page_markdown(markdown, page=page, config=None, files=None)
+
+    @pytest.fixture
+    def render_calls(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        calls: list[str] = []
+        render_tags = SqlAlchemyPlugin._render_tags
+
+        def _spy(self, markdown, matches, src_path):
+            calls.append(markdown)
+            return render_tags(self, markdown, matches, src_path)
+
+        monkeypatch.setattr(SqlAlchemyPlugin, "_render_tags", _spy)
+        return calls
+
+    def test_hit_on_unchanged_source(self, render_calls: list[str]):
+        """Test that an unchanged page is served from the cache."""
+        plugin = self._plugin()
+
+        first = self._render(plugin, MARKDOWN)
+        second = self._render(plugin, MARKDOWN)
+
+        assert first is not None
+        assert second is first
+        assert render_calls == [MARKDOWN]
+
+    def test_miss_after_edit(self, render_calls: list[str]):
+        """Test that an edited page is rendered again."""
+        plugin = self._plugin()
+        edited = MARKDOWN + "\nMore text.\n"
+
+        self._render(plugin, MARKDOWN)
+        result = self._render(plugin, edited)
+
+        assert render_calls == [MARKDOWN, edited]
+        assert result.endswith("More text.\n")
+
+    def test_failed_page_not_cached(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that pages with failed tags are not stored."""
+        plugin = self._plugin()
+
+        def _fail(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(plugin_module, "generate_content_from_params", _fail)
+        result = self._render(plugin, '{% sqlalchemy table="users" %}')
+
+        assert "Error generating SQLAlchemy documentation: boom" in result
+        assert plugin._page_cache == {}
+
+    def test_kept_on_unchanged_config(self):
+        """Test that reloading the same configuration keeps the cache."""
+        plugin = self._plugin()
+        self._render(plugin, MARKDOWN)
+        fingerprint = plugin._cache_fingerprint
+
+        plugin.on_config(MkDocsConfig())
+
+        assert plugin._cache_fingerprint == fingerprint
+        assert "index.md" in plugin._page_cache
+
+    def test_reset_on_config_change(self):
+        """Test that a configuration change clears the cache."""
+        plugin = self._plugin()
+        self._render(plugin, MARKDOWN)
+        fingerprint = plugin._cache_fingerprint
+
+        plugin.load_config(
+            {"base_class": "tests.fixtures.models.Base", "display": {"show_sql": True}}
+        )
+        plugin.on_config(MkDocsConfig())
+
+        assert plugin._cache_fingerprint != fingerprint
+        assert plugin._page_cache == {}
+
+    def test_reset_on_base_class_change(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that loading a different base class clears the cache."""
+        plugin = self._plugin()
+        self._render(plugin, MARKDOWN)
+        fingerprint = plugin._cache_fingerprint
+
+        class OtherBase(DeclarativeBase):
+            pass
+
+        monkeypatch.setattr(plugin, "_load_base_class", lambda: OtherBase)
+        plugin.on_config(MkDocsConfig())
+
+        assert plugin._cache_fingerprint != fingerprint
+        assert plugin._page_cache == {}
+
+
+class TestBaseClassCache:
+    """Tests for the base class cache kept by each plugin instance."""
+
+    def test_not_shared_between_instances(self):
+        """Test that a base class cached by one site is not seen by another."""
+        first = TestPageCache._plugin()
+        second = TestPageCache._plugin()
+
+        class OtherBase(DeclarativeBase):
+            pass
+
+        for key in first._base_class_cache:
+            first._base_class_cache[key] = OtherBase
+
+        assert first._load_base_class() is OtherBase
+        assert second._load_base_class() is not OtherBase
@@ -2,9 +2,10 @@ import re
 
 import pytest
 
-from mkdocs_sqlalchemy_plugin.config import TAG_PATTERN
+from mkdocs_sqlalchemy_plugin.config import TAG_PATTERN, TAG_RE
 from mkdocs_sqlalchemy_plugin.utils import (
     FIELD_NAMES,
+    find_tag_matches,
     match_tag_regex,
     parse_fields,
     parse_table_list,
@@ -72,7 +73,7 @@ class TestMatchTagRegex:
         self, markdown: str, expected_matches: list[str], expected_count: int
     ):
         """Test matching SQLAlchemy tags in markdown."""
-        result = match_tag_regex(markdown, TAG_PATTERN)
+        result = match_tag_regex(markdown, TAG_RE)
 
         assert len(result) == expected_count, (
             f"Expected {expected_count} matches, got {len(result)}"
@@ -94,6 +95,16 @@ class TestMatchTagRegex:
         assert result[0].group(0) == '{% sqlalchemy table="users" %}'
         assert result[0].group(1) == 'table="users"'  # Captured group
 
+    def test_match_tag_regex_with_compiled_pattern(self):
+        """Test that a precompiled pattern matches the same tags as the string."""
+        markdown = '{% sqlalchemy %} and {% sqlalchemy table="orders" %}'
+
+        compiled = [m.group(0) for m in match_tag_regex(markdown, TAG_RE)]
+        raw = [m.group(0) for m in match_tag_regex(markdown, TAG_PATTERN)]
+
+        assert compiled == raw
+        assert TAG_RE.pattern == TAG_PATTERN
+
     def test_match_tag_regex_with_multiline(self):
         """Test matching tags across multiple lines."""
         markdown = """
@@ -110,6 +121,42 @@ class TestMatchTagRegex:
         assert len(result) == 2
 
 
+class TestFindTagMatches:
+    """Tests for find_tag_matches function."""
+
+    @pytest.mark.parametrize(
+        "markdown",
+        [
+            'Some text {% sqlalchemy table="users" %} more text',
+            "No tags here",
+            '{% sqlalchemy %} and {% sqlalchemy table="orders" %}',
+            "{%sqlalchemy%}",
+            "{%  sqlalchemy  %}",
+            "{% include 'x' %} {% sqlalchemy %} {% endraw %}",
+            "{% {% sqlalchemy %}",
+            "{ sqlalchemy }",
+        ],
+        ids=[
+            "single_tag_with_params",
+            "no_tags",
+            "multiple_tags",
+            "tag_without_spaces",
+            "tag_with_extra_spaces",
+            "other_template_tags",
+            "nested_prefix",
+            "missing_percent_signs",
+        ],
+    )
+    def test_find_tag_matches_agrees_with_regex(self, markdown: str):
+        """Test that the prefix scanner finds the same tags as a regex scan."""
+        found = [(m.span(), m.group(1)) for m in find_tag_matches(markdown, TAG_RE)]
+        expected = [
+            (m.span(), m.group(1)) for m in match_tag_regex(markdown, TAG_PATTERN)
+        ]
+
+        assert found == expected
+
+
 class TestParseFields:
     """Tests for parse_fields function."""
 
@@ -229,10 +276,12 @@ class TestParseTagParameters:
             ),
             ("", {}),
             (None, {}),
+            ("   ", {}),
             ('table="user profiles"', {"table": "user profiles"}),
             ('table=""', {"table": ""}),
             ('include_tables="users,products"', {"include_tables": "users,products"}),
             ('table="users"  fields="column"', {"table": "users", "fields": "column"}),
+            ('table="show_sql=true here"', {"table": "show_sql=true here"}),
         ],
         ids=[
             "single_string_parameter",
@@ -241,10 +290,12 @@ class TestParseTagParameters:
             "mixed_parameters",
             "empty_string",
             "none_input",
+            "whitespace_only",
             "parameter_with_spaces_in_value",
             "empty_string_value",
             "parameters_with_underscores",
             "multiple_spaces_between_parameters",
+            "boolean_syntax_inside_string_value",
         ],
     )
     def test_parse_tag_parameters(